@@ -2,6 +2,7 @@
 Agents API Routes - Trading bot management
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from typing import List
 from datetime import datetime
@@ -241,14 +242,12 @@ async def get_agent_signal(
     # Get signal from ML model abstraction layer
     model = get_model()
     target_assets = agent.config.get("target_assets", ["BTC"])
-    signals = {}
+    signals = await model.batch_predict(target_assets)
     
-    for asset in target_assets:
-        signal = await model.get_signal(asset)
-        signals[asset] = signal
-    
-    return {
+    # orjson serializes the TradingSignal dataclasses and Signal enums natively,
+    # skipping FastAPI's jsonable_encoder walk over the signal dict
+    return ORJSONResponse({
         "agent_id": agent.agent_id,
         "signals": signals,
         "model_type": "mock" if not model.is_real_model else "production"
-    }
+    })
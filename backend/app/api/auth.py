@@ -2,6 +2,7 @@
 Authentication API Routes
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from datetime import timedelta
@@ -40,11 +41,11 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
             detail="An account with this email already exists"
         )
     
-    # Create new user
+    # Create new user (bcrypt is CPU-bound, keep it off the event loop)
     new_user = User(
         full_name=user_data.full_name,
         email=user_data.email.lower(),
-        hashed_password=get_password_hash(user_data.password)
+        hashed_password=await run_in_threadpool(get_password_hash, user_data.password)
     )
     db.add(new_user)
     db.commit()
@@ -63,7 +64,9 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session =
     """Login and get access token"""
     user = db.query(User).filter(User.email == form_data.username.lower()).first()
     
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await run_in_threadpool(
+        verify_password, form_data.password, user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
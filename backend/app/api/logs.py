@@ -2,6 +2,7 @@
 System Logs API Routes
 """
 from fastapi import APIRouter, Depends, Query
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from typing import Optional
 
@@ -74,22 +75,30 @@ async def get_log_stats(
     db: Session = Depends(get_db)
 ):
     """Get log statistics"""
-    base_query = db.query(SystemLog).filter(SystemLog.user_id == current_user.id)
+    # One grouped query per dimension instead of a COUNT round trip per value
+    def count_by(column):
+        rows = db.query(column, func.count(SystemLog.id)).filter(
+            SystemLog.user_id == current_user.id
+        ).group_by(column).all()
+        return dict(rows)
+    
+    level_counts = count_by(SystemLog.level)
+    category_counts = count_by(SystemLog.category)
     
     stats = {
-        "total": base_query.count(),
+        "total": sum(level_counts.values()),
         "by_level": {
-            "info": base_query.filter(SystemLog.level == LogLevel.INFO).count(),
-            "warning": base_query.filter(SystemLog.level == LogLevel.WARNING).count(),
-            "error": base_query.filter(SystemLog.level == LogLevel.ERROR).count(),
-            "success": base_query.filter(SystemLog.level == LogLevel.SUCCESS).count()
+            "info": level_counts.get(LogLevel.INFO, 0),
+            "warning": level_counts.get(LogLevel.WARNING, 0),
+            "error": level_counts.get(LogLevel.ERROR, 0),
+            "success": level_counts.get(LogLevel.SUCCESS, 0)
         },
         "by_category": {
-            "auth": base_query.filter(SystemLog.category == LogCategory.AUTH).count(),
-            "trade": base_query.filter(SystemLog.category == LogCategory.TRADE).count(),
-            "agent": base_query.filter(SystemLog.category == LogCategory.AGENT).count(),
-            "system": base_query.filter(SystemLog.category == LogCategory.SYSTEM).count(),
-            "risk": base_query.filter(SystemLog.category == LogCategory.RISK).count()
+            "auth": category_counts.get(LogCategory.AUTH, 0),
+            "trade": category_counts.get(LogCategory.TRADE, 0),
+            "agent": category_counts.get(LogCategory.AGENT, 0),
+            "system": category_counts.get(LogCategory.SYSTEM, 0),
+            "risk": category_counts.get(LogCategory.RISK, 0)
         }
     }
     
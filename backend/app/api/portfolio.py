@@ -2,6 +2,8 @@
 Portfolio API Routes - Holdings and performance data
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from typing import List
 from datetime import datetime, timedelta
@@ -16,7 +18,6 @@ from app.schemas.portfolio import (
     HoldingCreate,
     HoldingResponse,
     PerformanceResponse,
-    PerformanceDataPoint,
     AllocationResponse
 )
 
@@ -44,6 +45,35 @@ def calculate_holding_response(holding: Holding) -> dict:
     }
 
 
+def calculate_type_totals(db: Session, user_id: int) -> tuple:
+    """
+    Sum holding values per asset type for a user's portfolio.
+    
+    Aggregates in SQL (one row per asset type) instead of loading every
+    Holding. Returns (type_totals, total_value, holding_count).
+    """
+    rows = db.query(
+        Holding.asset_type,
+        func.sum(Holding.quantity * Holding.current_price),
+        func.count(Holding.id)
+    ).join(Portfolio, Holding.portfolio_id == Portfolio.id).filter(
+        Portfolio.user_id == user_id
+    ).group_by(Holding.asset_type).all()
+    
+    type_totals = {"Crypto": 0, "Stock": 0, "Forex": 0, "Commodity": 0}
+    total_value = 0
+    holding_count = 0
+    
+    for asset_type, value, count in rows:
+        value = value or 0
+        total_value += value
+        holding_count += count
+        if asset_type in type_totals:
+            type_totals[asset_type] += value
+    
+    return type_totals, total_value, holding_count
+
+
 @router.get("", response_model=PortfolioResponse)
 async def get_portfolio(
     current_user: User = Depends(get_current_user),
@@ -151,29 +181,33 @@ async def get_performance(
     base_value = 100000
     data_points = []
     current_value = base_value
+    now = datetime.now()  # Single clock read keeps every date on the same "today"
     
     for i in range(0, days, max(days // 30, 1)):  # ~30 data points
-        date = (datetime.now() - timedelta(days=days - i)).strftime("%Y-%m-%d")
+        date = (now - timedelta(days=days - i)).strftime("%Y-%m-%d")
         # Simulate growth with some volatility
         change = random.uniform(-0.02, 0.03)
         current_value = current_value * (1 + change)
-        data_points.append(PerformanceDataPoint(date=date, value=round(current_value, 2)))
+        data_points.append({"date": date, "value": round(current_value, 2)})
     
     # Ensure last point is today
-    data_points.append(PerformanceDataPoint(
-        date=datetime.now().strftime("%Y-%m-%d"),
-        value=round(current_value, 2)
-    ))
+    data_points.append({
+        "date": now.strftime("%Y-%m-%d"),
+        "value": round(current_value, 2)
+    })
     
     total_return = current_value - base_value
     percent_change = (total_return / base_value) * 100
     
-    return PerformanceResponse(
-        period=period,
-        data=data_points,
-        total_return=round(total_return, 2),
-        percent_change=round(percent_change, 2)
-    )
+    # Built from trusted values already in PerformanceResponse shape; returning
+    # the Response directly skips per-point model construction and the
+    # response_model re-validation (response_model still documents the schema)
+    return ORJSONResponse({
+        "period": period,
+        "data": data_points,
+        "total_return": round(total_return, 2),
+        "percent_change": round(percent_change, 2)
+    })
 
 
 @router.get("/allocation", response_model=AllocationResponse)
@@ -182,22 +216,8 @@ async def get_allocation(
     db: Session = Depends(get_db)
 ):
     """Get portfolio allocation breakdown"""
-    portfolio = db.query(Portfolio).filter(Portfolio.user_id == current_user.id).first()
-    
-    if not portfolio:
-        return AllocationResponse(
-            crypto=0, stocks=0, forex=0, commodities=0, cash=100
-        )
-    
-    # Calculate allocation from holdings
-    type_totals = {"Crypto": 0, "Stock": 0, "Forex": 0, "Commodity": 0}
-    total_value = 0
-    
-    for holding in portfolio.holdings:
-        value = holding.quantity * holding.current_price
-        total_value += value
-        if holding.asset_type in type_totals:
-            type_totals[holding.asset_type] += value
+    # Calculate allocation from holdings (no portfolio means no holdings)
+    type_totals, total_value, _ = calculate_type_totals(db, current_user.id)
     
     if total_value == 0:
         return AllocationResponse(
@@ -7,11 +7,24 @@ from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.core.security import get_current_user
 from app.models.user import User
-from app.models.portfolio import Portfolio
 from app.schemas.user import RiskSettings
+from app.api.portfolio import calculate_type_totals
 
 router = APIRouter()
 
+# Static until metrics are calculated from historical data, so build it once
+MOCK_RISK_METRICS = {
+    "value_at_risk": {
+        "daily_var_95": 2.5,
+        "weekly_var_95": 5.8,
+        "level": "low"
+    },
+    "sharpe_ratio": 1.45,
+    "max_drawdown": -12.3,
+    "volatility": 18.5,
+    "beta": 0.85
+}
+
 
 @router.get("/settings", response_model=RiskSettings)
 async def get_risk_settings(current_user: User = Depends(get_current_user)):
@@ -38,9 +51,9 @@ async def get_risk_exposure(
     db: Session = Depends(get_db)
 ):
     """Get current risk exposure breakdown"""
-    portfolio = db.query(Portfolio).filter(Portfolio.user_id == current_user.id).first()
+    type_totals, total_value, holding_count = calculate_type_totals(db, current_user.id)
     
-    if not portfolio or not portfolio.holdings:
+    if not holding_count:
         return {
             "total_exposure": 0,
             "exposure_by_type": {
@@ -53,16 +66,6 @@ async def get_risk_exposure(
             "warnings": []
         }
     
-    # Calculate exposure
-    type_totals = {"Crypto": 0, "Stock": 0, "Forex": 0, "Commodity": 0}
-    total_value = 0
-    
-    for holding in portfolio.holdings:
-        value = holding.quantity * holding.current_price
-        total_value += value
-        if holding.asset_type in type_totals:
-            type_totals[holding.asset_type] += value
-    
     # Calculate percentages
     exposure = {}
     for asset_type, value in type_totals.items():
@@ -72,14 +75,15 @@ async def get_risk_exposure(
     # Check for warnings based on risk settings
     warnings = []
     max_position = current_user.risk_settings.get("max_position_size", 10)
+    concentration_limit = max_position * 3  # 3x max position = warning
     
     for asset_type, pct in exposure.items():
-        if pct > max_position * 3:  # 3x max position = warning
+        if pct > concentration_limit:
             warnings.append({
                 "type": "high_concentration",
                 "asset_type": asset_type,
                 "current": pct,
-                "recommended_max": max_position * 3,
+                "recommended_max": concentration_limit,
                 "message": f"High concentration in {asset_type}: {pct}%"
             })
     
@@ -97,14 +101,4 @@ async def get_risk_metrics(
 ):
     """Get risk metrics (VaR, Sharpe, etc.) - mock data for now"""
     # In production, these would be calculated from historical data
-    return {
-        "value_at_risk": {
-            "daily_var_95": 2.5,
-            "weekly_var_95": 5.8,
-            "level": "low"
-        },
-        "sharpe_ratio": 1.45,
-        "max_drawdown": -12.3,
-        "volatility": 18.5,
-        "beta": 0.85
-    }
+    return MOCK_RISK_METRICS
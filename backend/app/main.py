@@ -1,18 +1,32 @@
 """
 Wekeza Backend - Main Application Entry Point
 """
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
 from app.api import auth, agents, portfolio, risk, logs
+from app.services.ml_model import get_model
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up the shared ML model before serving requests"""
+    get_model()
+    yield
+
 
 app = FastAPI(
     title="Wekeza API",
     description="Backend API for Wekeza Quantitative Investment Platform",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS Middleware - Allow frontend to make requests
@@ -19,15 +19,21 @@ Example:
     # return MockModel()  to  return TensorModel()
 """
 
+from functools import lru_cache
+
 from app.services.ml_model.interface import ModelInterface
 from app.services.ml_model.mock_model import MockModel
 from app.core.config import settings
 
 
+@lru_cache(maxsize=None)
 def get_model() -> ModelInterface:
     """
     Factory function to get the appropriate ML model.
     
+    The instance is built once and shared by every caller, so loading
+    weights in a model's __init__ only happens on first use.
+    
     Change this when the real model is ready:
         from app.services.ml_model.tensor_model import TensorModel
         return TensorModel()
@@ -6,6 +6,7 @@ Replace with the real model when ready.
 """
 
 import random
+from bisect import bisect_left
 from typing import Dict, Any, List
 
 from app.services.ml_model.interface import (
@@ -16,6 +17,19 @@ from app.services.ml_model.interface import (
 )
 
 
+# Sentiment cut-offs (ascending) and the signal for each band between them.
+# bisect_left counts the thresholds strictly below the sentiment, so a value
+# equal to a cut-off falls into the lower band, matching the "> x" checks.
+_SIGNAL_THRESHOLDS = (0.3, 0.45, 0.55, 0.7)
+_SIGNAL_BANDS = (
+    (Signal.STRONG_SELL, "Strong sell signal for {}"),
+    (Signal.SELL, "Bearish indicators emerging for {}"),
+    (Signal.HOLD, "Mixed signals, recommend holding {}"),
+    (Signal.BUY, "Positive trend indicators for {}"),
+    (Signal.STRONG_BUY, "Strong bullish momentum detected for {}"),
+)
+
+
 class MockModel(ModelInterface):
     """
     Mock implementation that returns random but realistic signals.
@@ -56,28 +70,22 @@ class MockModel(ModelInterface):
     
     async def get_signal(self, asset: str) -> TradingSignal:
         """Generate a mock trading signal for an asset"""
-        base_sentiment = self._sentiments.get(asset.upper(), 0.5)
+        return self._generate_signal(asset)
+    
+    def _generate_signal(self, asset: str) -> TradingSignal:
+        """Build a mock signal synchronously (shared by single and batch calls)"""
+        # Callers already pass upper-case symbols; only normalize on a miss
+        base_sentiment = self._sentiments.get(asset)
+        if base_sentiment is None:
+            base_sentiment = self._sentiments.get(asset.upper(), 0.5)
         
         # Add some randomness
         adjusted = base_sentiment + random.uniform(-0.2, 0.2)
         adjusted = max(0, min(1, adjusted))  # Clamp to 0-1
         
         # Determine signal based on adjusted sentiment
-        if adjusted > 0.7:
-            signal = Signal.STRONG_BUY
-            reasoning = f"Strong bullish momentum detected for {asset}"
-        elif adjusted > 0.55:
-            signal = Signal.BUY
-            reasoning = f"Positive trend indicators for {asset}"
-        elif adjusted > 0.45:
-            signal = Signal.HOLD
-            reasoning = f"Mixed signals, recommend holding {asset}"
-        elif adjusted > 0.3:
-            signal = Signal.SELL
-            reasoning = f"Bearish indicators emerging for {asset}"
-        else:
-            signal = Signal.STRONG_SELL
-            reasoning = f"Strong sell signal for {asset}"
+        signal, reasoning = _SIGNAL_BANDS[bisect_left(_SIGNAL_THRESHOLDS, adjusted)]
+        reasoning = reasoning.format(asset)
         
         predicted_change = (adjusted - 0.5) * 10  # -5% to +5%
         
@@ -124,7 +132,5 @@ class MockModel(ModelInterface):
     
     async def batch_predict(self, assets: List[str]) -> Dict[str, TradingSignal]:
         """Get signals for multiple assets"""
-        signals = {}
-        for asset in assets:
-            signals[asset] = await self.get_signal(asset)
-        return signals
+        # No per-asset await: the mock has no I/O, so build all signals in one pass
+        return {asset: self._generate_signal(asset) for asset in assets}
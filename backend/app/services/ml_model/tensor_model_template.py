@@ -10,6 +10,7 @@ To integrate:
 3. Update __init__.py to use this model instead of MockModel
 """
 
+import asyncio
 from typing import Dict, Any, List
 
 from app.services.ml_model.interface import (
@@ -93,11 +94,12 @@ class TensorModel(ModelInterface):
         Get signals for multiple assets at once.
         
         TODO: Implement batch prediction for efficiency
+        
+        Assets are independent, so their signals are awaited concurrently:
+        total latency is the slowest asset rather than the sum of all.
         """
-        signals = {}
-        for asset in assets:
-            signals[asset] = await self.get_signal(asset)
-        return signals
+        results = await asyncio.gather(*(self.get_signal(asset) for asset in assets))
+        return dict(zip(assets, results))
     
     # Helper methods your friend might need:
     